@@ -0,0 +1,100 @@
+import multiprocessing
+import multiprocessing.synchronize
+import queue
+import threading
+from typing import Callable, Optional, Union
+
+from loguru import logger
+
+from bizon.source.models import SourceIteration
+
+# How long a blocked get/put waits before checking the stop events again
+PREFETCH_POLL_INTERVAL = 0.5
+
+
+class SourcePrefetcher:
+    """Fetch source iterations ahead of the producer in a background thread.
+
+    Fetching iteration N+1 only needs the pagination returned by iteration N, so the fetch chain can
+    run independently of the producer loop, which keeps converting, enqueuing and checkpointing
+    iteration N. Iterations are handed over strictly in order through a bounded queue: at most
+    `depth` iterations are fetched ahead of the one being processed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[dict], SourceIteration],
+        depth: int,
+        iteration: int,
+        pagination: dict,
+        max_iterations: Optional[int] = None,
+    ):
+        assert depth > 0, "Prefetch depth must be strictly positive"
+
+        self.fetch = fetch
+        self.iteration = iteration
+        self.pagination = pagination
+        self.max_iterations = max_iterations
+
+        self._results: queue.Queue = queue.Queue(maxsize=depth)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="bizon-source-prefetch", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Stop fetching ahead, an in-flight fetch is left to complete in the background"""
+        self._stop_event.set()
+
+    def _put(self, item: Union[SourceIteration, Exception]) -> bool:
+        """Hand over an item to the producer, return False if we were stopped while waiting"""
+        while not self._stop_event.is_set():
+            try:
+                self._results.put(item, timeout=PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if self.max_iterations and self.iteration > self.max_iterations:
+                return
+
+            try:
+                source_iteration = self.fetch(self.pagination)
+            except Exception as e:
+                # Surfaced to the producer when it reaches this iteration
+                self._put(e)
+                return
+
+            if not self._put(source_iteration):
+                return
+
+            logger.debug(f"Prefetched iteration {self.iteration}, {self._results.qsize()} iterations ready.")
+
+            # An empty pagination means the source is exhausted, see Cursor.update_state
+            if not source_iteration.next_pagination:
+                return
+
+            self.pagination = source_iteration.next_pagination
+            self.iteration += 1
+
+    def get(self, stop_event: Union[multiprocessing.synchronize.Event, threading.Event]) -> Optional[SourceIteration]:
+        """Return the next fetched iteration, or None if stop_event was set while waiting.
+        Re-raise the exception if fetching this iteration failed.
+        """
+        while not stop_event.is_set():
+            try:
+                item = self._results.get(timeout=PREFETCH_POLL_INTERVAL)
+            except queue.Empty:
+                if not self._thread.is_alive() and self._results.empty():
+                    raise RuntimeError("Source prefetcher stopped without returning the next iteration")
+                continue
+
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        return None
@@ -4,8 +4,9 @@ import multiprocessing.synchronize
 import threading
 import traceback
 from datetime import datetime
+from functools import partial
 from time import sleep
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from loguru import logger
 from pytz import UTC
@@ -16,10 +17,11 @@ from bizon.engine.backend.models import CursorStatus
 from bizon.engine.queue.queue import AbstractQueue
 from bizon.source.config import SourceSyncModes
 from bizon.source.cursor import Cursor
-from bizon.source.models import SourceIncrementalState
+from bizon.source.models import SourceIncrementalState, SourceIteration
 from bizon.source.source import AbstractSource
 
 from .models import PipelineReturnStatus
+from .prefetch import SourcePrefetcher
 
 
 class Producer:
@@ -120,6 +122,23 @@ class Producer:
 
         return False, queue_size, approximate_nb_records_in_queue
 
+    @property
+    def prefetch_depth(self) -> int:
+        """Number of source iterations to fetch ahead, 0 if prefetching is disabled"""
+        runner_config = self.bizon_config.engine.runner.config
+        return runner_config.prefetch_depth if runner_config else 0
+
+    def fetch_source_iteration(
+        self, pagination: dict, source_incremental_state: Optional[SourceIncrementalState] = None
+    ) -> SourceIteration:
+        """Fetch the next iteration from the source for the given pagination"""
+        if source_incremental_state:
+            # Use incremental fetching with get_records_after
+            return self.source.get_records_after(source_state=source_incremental_state, pagination=pagination)
+
+        # Use standard fetching with get
+        return self.source.get(pagination=pagination)
+
     def run(
         self, job_id: int, stop_event: Union[multiprocessing.synchronize.Event, threading.Event]
     ) -> PipelineReturnStatus:
@@ -185,9 +204,24 @@ class Producer:
                 )
                 is_incremental = False
 
+        # Fetch the next iterations in the background while the current one is being enqueued
+        prefetcher = None
+        if self.prefetch_depth > 0:
+            logger.info(f"Prefetching up to {self.prefetch_depth} source iterations ahead.")
+            prefetcher = SourcePrefetcher(
+                fetch=partial(self.fetch_source_iteration, source_incremental_state=source_incremental_state),
+                depth=self.prefetch_depth,
+                iteration=cursor.iteration,
+                pagination=cursor.pagination,
+                max_iterations=self.source.config.max_iterations,
+            )
+            prefetcher.start()
+
         while not cursor.is_finished:
             if stop_event.is_set():
                 logger.info("Stop event is set, terminating producer ...")
+                if prefetcher:
+                    prefetcher.stop()
                 return PipelineReturnStatus.KILLED_BY_RUNNER
 
             timestamp_start_iteration = datetime.now(tz=UTC)
@@ -235,15 +269,15 @@ class Producer:
 
             # Get the next data
             try:
-                if is_incremental and source_incremental_state:
-                    # Use incremental fetching with get_records_after
-                    source_iteration = self.source.get_records_after(
-                        source_state=source_incremental_state,
-                        pagination=cursor.pagination,
-                    )
+                if prefetcher:
+                    source_iteration = prefetcher.get(stop_event=stop_event)
+                    # Stop event was set while waiting for the source, handled on next loop turn
+                    if source_iteration is None:
+                        continue
                 else:
-                    # Use standard fetching with get
-                    source_iteration = self.source.get(pagination=cursor.pagination)
+                    source_iteration = self.fetch_source_iteration(
+                        pagination=cursor.pagination, source_incremental_state=source_incremental_state
+                    )
             except Exception as e:
                 logger.error(traceback.format_exc())
                 logger.error(
@@ -272,7 +306,7 @@ class Producer:
             # Update the cursor state
             try:
                 cursor.update_state(
-                    pagination_dict=source_iteration.next_pagination, nb_records_fetched=len(source_iteration.records)
+                    pagination_dict=source_iteration.next_pagination, nb_records_fetched=source_iteration.nb_records
                 )
             except Exception as e:
                 logger.error(traceback.format_exc())
@@ -290,6 +324,9 @@ class Producer:
                 f"Iteration {cursor.iteration} finished in {datetime.now(tz=UTC) - timestamp_start_iteration}. {items_in_queue}"
             )
 
+        if prefetcher:
+            prefetcher.stop()
+
         logger.info("Terminating destination ...")
 
         try:
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -9,8 +10,20 @@ from bizon.engine.queue.config import (
 )
 
 
+class PythonQueueTransport(str, Enum):
+    # Messages are pickled through the multiprocessing manager process
+    MANAGER = "manager"
+    # DataFrames are published as Arrow IPC in shared memory, only a descriptor goes through the manager
+    SHARED_MEMORY = "shared_memory"
+
+
 class PythonQueueQueueConfig(BaseModel):
     max_size: int = Field(0, description="Maximum size of the queue, by default 0 means unlimited")
+    transport: PythonQueueTransport = Field(
+        PythonQueueTransport.MANAGER,
+        description="How batches are passed between producer and consumer processes with the process runner. "
+        "Ignored by the thread runner, which shares memory already.",
+    )
 
 
 class PythonQueueConsumerConfig(BaseModel):
@@ -0,0 +1,86 @@
+import dataclasses
+import os
+import shutil
+import tempfile
+from typing import Optional
+from uuid import uuid4
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from loguru import logger
+
+from bizon.engine.queue.config import QueueMessage
+
+# tmpfs mount, files created there never touch the disk
+SHARED_MEMORY_DIRECTORY = "/dev/shm"
+
+
+def create_shared_memory_directory() -> str:
+    """Create a private directory to publish the batches of a run, in shared memory when available"""
+    directory = SHARED_MEMORY_DIRECTORY if os.path.isdir(SHARED_MEMORY_DIRECTORY) else None
+
+    if directory is None:
+        logger.warning("No shared memory mount found, batches will be published in the temporary directory.")
+
+    return tempfile.mkdtemp(prefix="bizon-queue-", dir=directory)
+
+
+def remove_shared_memory_directory(directory: str):
+    """Remove the directory and any batch left behind by a consumer that did not run to completion"""
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class SharedMemoryQueue:
+    """Queue-like wrapper publishing the DataFrame of each QueueMessage as an Arrow IPC file in shared memory.
+
+    Only a small descriptor (the message without its DataFrame, plus the file path) goes through the
+    underlying queue, usually a `multiprocessing.Manager().Queue` proxy. The consumer memory-maps the
+    file and builds its DataFrame on top of the mapping, then unlinks the file: the pages stay mapped
+    until the DataFrame is released, so nothing is copied on the consumer side.
+
+    Exposes the subset of the `queue.Queue` interface used by PythonQueue and its consumer, and is
+    picklable so it can be handed to ProcessPoolExecutor workers.
+    """
+
+    def __init__(self, queue, directory: str):
+        self.queue = queue
+        self.directory = directory
+
+    def put(self, queue_message: QueueMessage, block: bool = True, timeout: Optional[float] = None):
+        path = os.path.join(self.directory, f"{uuid4().hex}.arrow")
+
+        # IPC files must be uncompressed to be memory-mapped
+        queue_message.df_source_records.write_ipc(path, compression="uncompressed")
+
+        descriptor = dataclasses.replace(queue_message, df_source_records=None)
+
+        try:
+            self.queue.put((path, descriptor), block=block, timeout=timeout)
+        except Exception:
+            os.unlink(path)
+            raise
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> QueueMessage:
+        path, queue_message = self.queue.get(block=block, timeout=timeout)
+
+        with pa.memory_map(path) as source:
+            table = ipc.open_file(source).read_all()
+
+        # The mapping outlives the file, it is released with the last buffer referencing it
+        os.unlink(path)
+
+        queue_message.df_source_records = pl.from_arrow(table)
+        return queue_message
+
+    def qsize(self) -> int:
+        return self.queue.qsize()
+
+    def empty(self) -> bool:
+        return self.queue.empty()
+
+    def full(self) -> bool:
+        return self.queue.full()
+
+    def task_done(self):
+        self.queue.task_done()
@@ -1,30 +1,76 @@
 import concurrent.futures
+import multiprocessing
 import time
 import traceback
+from multiprocessing.managers import SyncManager
+from typing import Optional
 
 from loguru import logger
 
+from bizon.engine.queue.adapters.python_queue.config import PythonQueueTransport
 from bizon.engine.runner.runner import AbstractRunner
 
+# Polars' thread pool does not survive a fork once it has been used in the parent process,
+# workers are started from a fresh interpreter instead
+MULTIPROCESSING_START_METHOD = "spawn"
+
 
 class ProcessRunner(AbstractRunner):
     def __init__(self, config: dict):
         super().__init__(config)
+        self._manager: Optional[SyncManager] = None
+        self._shared_memory_directory: Optional[str] = None
+
+    @property
+    def manager(self) -> SyncManager:
+        """Manager process serving the objects shared between producer and consumer processes"""
+        if self._manager is None:
+            self._manager = multiprocessing.get_context(MULTIPROCESSING_START_METHOD).Manager()
+        return self._manager
 
     # TODO: refacto this
     def get_kwargs(self):
         if self.bizon_config.engine.queue.type == "python_queue":
-            from multiprocessing import Manager
+            queue_config = self.bizon_config.engine.queue.config.queue
+            queue = self.manager.Queue(maxsize=queue_config.max_size)
+
+            if queue_config.transport == PythonQueueTransport.SHARED_MEMORY:
+                from bizon.engine.queue.adapters.python_queue.shared_memory import (
+                    SharedMemoryQueue,
+                    create_shared_memory_directory,
+                )
+
+                if self._shared_memory_directory is None:
+                    self._shared_memory_directory = create_shared_memory_directory()
+
+                queue = SharedMemoryQueue(queue=queue, directory=self._shared_memory_directory)
 
-            manager = Manager()
-            queue = manager.Queue(maxsize=self.bizon_config.engine.queue.config.queue.max_size)
             return {"queue": queue}
 
         return {}
 
+    def cleanup(self):
+        """Release the manager process and the shared memory left behind by the run"""
+        if self._shared_memory_directory is not None:
+            from bizon.engine.queue.adapters.python_queue.shared_memory import (
+                remove_shared_memory_directory,
+            )
+
+            remove_shared_memory_directory(self._shared_memory_directory)
+            self._shared_memory_directory = None
+
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
     def run(self):
-        """Run the pipeline with dedicated threads for source and destination"""
+        """Run the pipeline with dedicated processes for source and destination"""
+        try:
+            return self._run()
+        finally:
+            self.cleanup()
 
+    def _run(self):
         extra_kwargs = self.get_kwargs()
         job = AbstractRunner.init_job(bizon_config=self.bizon_config, config=self.config, **extra_kwargs)
 
@@ -32,14 +78,20 @@ class ProcessRunner(AbstractRunner):
         result_producer = None
         result_consumer = None
 
+        # Start the producer and consumer events, proxied by the manager to be shared across processes
+        producer_stop_event = self.manager.Event()
+        consumer_stop_event = self.manager.Event()
+
         with concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.bizon_config.engine.runner.config.max_workers
+            max_workers=self.bizon_config.engine.runner.config.max_workers,
+            mp_context=multiprocessing.get_context(MULTIPROCESSING_START_METHOD),
         ) as executor:
             future_producer = executor.submit(
                 AbstractRunner.instanciate_and_run_producer,
                 self.bizon_config,
                 self.config,
                 job.id,
+                producer_stop_event,
                 **extra_kwargs,
             )
             logger.info("Producer process has started ...")
@@ -51,6 +103,7 @@ class ProcessRunner(AbstractRunner):
                 self.bizon_config,
                 self.config,
                 job.id,
+                consumer_stop_event,
                 **extra_kwargs,
             )
             logger.info("Consumer process has started ...")
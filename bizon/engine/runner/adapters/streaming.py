@@ -122,21 +122,31 @@ class StreamingRunner(AbstractRunner):
 
                 destination_id_indexed_records = {}
 
-                if len(source_iteration.records) == 0:
+                if source_iteration.nb_records == 0:
                     logger.info("No new records found, stopping iteration")
                     time.sleep(2)
                     monitor.track_pipeline_status(PipelineReturnStatus.SUCCESS)
                     iteration += 1
                     continue
 
-                for record in source_iteration.records:
-                    if destination_id_indexed_records.get(record.destination_id):
-                        destination_id_indexed_records[record.destination_id].append(record)
-                    else:
-                        destination_id_indexed_records[record.destination_id] = [record]
+                if source_iteration.df_records is not None:
+                    # Columnar batch from the source, split it by destination without building records
+                    for (destination_id,), df_records in source_iteration.df_records.partition_by(
+                        "destination_id", as_dict=True, maintain_order=True
+                    ).items():
+                        destination_id_indexed_records[destination_id] = df_records
+                else:
+                    for record in source_iteration.records:
+                        if destination_id_indexed_records.get(record.destination_id):
+                            destination_id_indexed_records[record.destination_id].append(record)
+                        else:
+                            destination_id_indexed_records[record.destination_id] = [record]
 
                 for destination_id, records in destination_id_indexed_records.items():
-                    df_source_records = StreamingRunner.convert_source_records(records)
+                    if isinstance(records, pl.DataFrame):
+                        df_source_records = records
+                    else:
+                        df_source_records = StreamingRunner.convert_source_records(records)
 
                     dsm_headers = monitor.track_source_iteration(records=records)
 
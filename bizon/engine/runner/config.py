@@ -34,6 +34,12 @@ class RunnerFuturesConfig(BaseModel):
         description="Duration in seconds to wait between checking if the producer and consumer threads are still running",
         default=2,
     )
+    prefetch_depth: int = Field(
+        description="Number of source iterations the producer fetches ahead while the current one is being enqueued. "
+        "Set to 0 to disable prefetching.",
+        default=0,
+        ge=0,
+    )
 
 
 class RunnerConfig(BaseModel):
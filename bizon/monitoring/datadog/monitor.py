@@ -2,6 +2,8 @@ import os
 from contextlib import contextmanager
 from typing import Dict, List, Union
 
+import orjson
+import polars as pl
 from datadog import initialize, statsd
 from loguru import logger
 
@@ -93,7 +95,9 @@ class DatadogMonitor(AbstractMonitor):
             tags=self.tags + [f"{key}:{value}" for key, value in extra_tags.items()],
         )
 
-    def track_source_iteration(self, records: List[SourceRecord]) -> Union[List[Dict[str, str]], None]:
+    def track_source_iteration(
+        self, records: Union[List[SourceRecord], pl.DataFrame]
+    ) -> Union[List[Dict[str, str]], None]:
         """
         Track the number of records consumed from a Kafka topic.
 
@@ -104,10 +108,16 @@ class DatadogMonitor(AbstractMonitor):
         if os.getenv("DD_DATA_STREAMS_ENABLED") == "true":
             from ddtrace.data_streams import set_consume_checkpoint
 
+            # Columnar batches carry the record payloads already dumped as JSON
+            if isinstance(records, pl.DataFrame):
+                records_data = [orjson.loads(data) for data in records["data"]]
+            else:
+                records_data = [record.data for record in records]
+
             headers_list = []
-            for record in records:
-                headers = record.data.get("headers", {})
-                set_consume_checkpoint("kafka", record.data["topic"], headers.get)
+            for data in records_data:
+                headers = data.get("headers", {})
+                set_consume_checkpoint("kafka", data["topic"], headers.get)
                 headers_list.append(headers)
             return headers_list
 
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Union
 
+import polars as pl
+
 from bizon.common.models import SyncMetadata
 from bizon.engine.pipeline.models import PipelineReturnStatus
 from bizon.monitoring.config import MonitoringConfig, MonitorType
@@ -22,7 +24,9 @@ class AbstractMonitor(ABC):
         """
         pass
 
-    def track_source_iteration(self, records: List[SourceRecord], headers: Dict[str, str] = {}) -> None:
+    def track_source_iteration(
+        self, records: Union[List[SourceRecord], pl.DataFrame], headers: Dict[str, str] = {}
+    ) -> None:
         """
         Run a process that tracks the source iteration.
         """
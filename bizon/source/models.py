@@ -1,8 +1,10 @@
+import json
 from datetime import datetime
 from typing import List, Optional, Union
 
 import polars as pl
-from pydantic import BaseModel, Field, field_validator
+import pyarrow as pa
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pytz import UTC
 
 # Define the SourceRecord model
@@ -38,8 +40,60 @@ class SourceRecord(BaseModel):
 
 
 class SourceIteration(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     next_pagination: dict = Field(..., description="Next pagination to be used in the next iteration")
-    records: List[SourceRecord] = Field(..., description="List of records retrieved in the current iteration")
+    records: List[SourceRecord] = Field(
+        default_factory=list, description="List of records retrieved in the current iteration"
+    )
+    df_records: Optional[pl.DataFrame] = Field(
+        default=None,
+        description="Columnar batch of records matching source_record_schema, with `data` already dumped as JSON. "
+        "Used as-is instead of `records` when set.",
+    )
+
+    @field_validator("df_records", mode="before")
+    def validate_df_records(cls, value: Union[pl.DataFrame, pa.Table, None]) -> Optional[pl.DataFrame]:
+        if value is None:
+            return None
+
+        # Arrow tables are converted without copying the underlying buffers
+        if isinstance(value, pa.Table):
+            value = pl.from_arrow(value)
+
+        if not isinstance(value, pl.DataFrame):
+            raise ValueError(f"df_records must be a polars DataFrame or a pyarrow Table, got {type(value)}")
+
+        missing_columns = set(source_record_schema.names()) - set(value.columns)
+        if missing_columns:
+            raise ValueError(f"df_records is missing columns {sorted(missing_columns)} from source_record_schema")
+
+        if value.schema == source_record_schema:
+            return value
+
+        return value.select([pl.col(name).cast(dtype) for name, dtype in source_record_schema.items()])
+
+    @property
+    def nb_records(self) -> int:
+        """Number of records retrieved in the current iteration"""
+        if self.df_records is not None:
+            return self.df_records.height
+        return len(self.records)
+
+    def to_df_source_records(self) -> pl.DataFrame:
+        """Return the records of the iteration as a DataFrame matching source_record_schema"""
+        if self.df_records is not None:
+            return self.df_records
+
+        return pl.DataFrame(
+            {
+                "id": [record.id for record in self.records],
+                "data": [json.dumps(record.data, ensure_ascii=False) for record in self.records],
+                "timestamp": [record.timestamp for record in self.records],
+                "destination_id": [record.destination_id for record in self.records],
+            },
+            schema=source_record_schema,
+        )
 
 
 class SourceIncrementalState(BaseModel):
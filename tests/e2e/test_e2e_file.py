@@ -56,3 +56,53 @@ def test_e2e_dummy_to_file():
 
         assert set(records_extracted.keys()) == set(["9898", "88787", "98", "3333", "56565"])
         assert json.loads(records_extracted["9898"]).get("name") == "BIZON"
+
+
+def test_e2e_dummy_to_file_process_runner_shared_memory(tmp_path):
+    BIZON_CONFIG_DUMMY_TO_FILE = f"""
+    name: test_job_process_shared_memory
+
+    source:
+      name: dummy
+      stream: creatures
+      authentication:
+        type: api_key
+        params:
+          token: dummy_key
+
+    destination:
+      name: file
+      config:
+        destination_id: {tmp_path / "creatures"}
+
+    engine:
+      backend:
+        type: sqlite
+        config:
+          database: {tmp_path / "bizon"}
+          schema: public
+          syncCursorInDBEvery: 2
+      queue:
+        type: python_queue
+        config:
+          queue:
+            transport: shared_memory
+      runner:
+        type: process
+        config:
+          consumer_start_delay: 0
+          is_alive_check_interval: 1
+    """
+
+    runner = RunnerFactory.create_from_config_dict(yaml.safe_load(BIZON_CONFIG_DUMMY_TO_FILE))
+
+    runner.run()
+
+    records_extracted = {}
+    with open(tmp_path / "creatures.json") as file:
+        for line in file.readlines():
+            record: dict = json.loads(line.strip())
+            records_extracted[record["source_record_id"]] = record["source_data"]
+
+    assert set(records_extracted.keys()) == set(["9898", "88787", "98", "3333", "56565"])
+    assert json.loads(records_extracted["9898"]).get("name") == "bizon"
@@ -4,6 +4,7 @@ import os
 import yaml
 
 from bizon.engine.engine import RunnerFactory
+from bizon.source.models import SourceIteration
 
 
 def test_e2e_dummy_streaming_to_file():
@@ -82,3 +83,57 @@ def test_e2e_dummy_streaming_to_file():
 
     assert set(records_extracted.keys()) == set([9898, 88787])
     assert records_extracted[9898] == "BIZON"
+
+
+def test_e2e_dummy_streaming_columnar_batches_to_file(monkeypatch, tmp_path):
+    """Sources returning a columnar batch are routed per destination_id without building records"""
+    from bizon.connectors.sources.dummy.src.source import DummySource
+
+    dummy_get = DummySource.get
+
+    def columnar_get(self, pagination: dict = None) -> SourceIteration:
+        source_iteration = dummy_get(self, pagination=pagination)
+        return SourceIteration(
+            next_pagination=source_iteration.next_pagination,
+            df_records=source_iteration.to_df_source_records(),
+        )
+
+    monkeypatch.setattr(DummySource, "get", columnar_get)
+    monkeypatch.chdir(tmp_path)
+
+    BIZON_CONFIG_DUMMY_TO_FILE = f"""
+      name: test_job_columnar
+
+      source:
+        name: dummy
+        stream: creatures
+        sync_mode: stream
+        authentication:
+          type: api_key
+          params:
+            token: dummy_key
+        max_iterations: 4
+
+      destination:
+        name: file
+        config:
+          format: json
+
+      engine:
+        runner:
+          type: stream
+        backend:
+          type: sqlite
+          config:
+            database: {tmp_path / "bizon"}
+            schema: public
+            syncCursorInDBEvery: 2
+      """
+
+    runner = RunnerFactory.create_from_config_dict(yaml.safe_load(BIZON_CONFIG_DUMMY_TO_FILE))
+    runner.run()
+
+    with open(tmp_path / "creatures.json") as file:
+        records_extracted = [json.loads(line.strip()) for line in file.readlines()]
+
+    assert {json.loads(record["source_data"])["id"] for record in records_extracted} == {9898, 88787}
@@ -0,0 +1,61 @@
+import os
+from datetime import datetime
+from multiprocessing import Manager
+
+import polars as pl
+from pytz import UTC
+
+from bizon.engine.queue.adapters.python_queue.shared_memory import (
+    SharedMemoryQueue,
+    create_shared_memory_directory,
+    remove_shared_memory_directory,
+)
+from bizon.engine.queue.config import QUEUE_TERMINATION, QueueMessage
+from bizon.source.models import source_record_schema
+
+df_source_records = pl.DataFrame(
+    {
+        "id": ["record_1", "record_2"],
+        "data": ['{"key": "value1"}', '{"key": "value2"}'],
+        "timestamp": [datetime(2024, 12, 5, 11, 30, tzinfo=UTC), datetime(2024, 12, 5, 12, 30, tzinfo=UTC)],
+        "destination_id": ["test", None],
+    },
+    schema=source_record_schema,
+)
+
+
+def test_shared_memory_queue_round_trip():
+    directory = create_shared_memory_directory()
+    manager = Manager()
+
+    try:
+        queue = SharedMemoryQueue(queue=manager.Queue(), directory=directory)
+
+        queue.put(QueueMessage(iteration=4, df_source_records=df_source_records, pagination={"cursor": "next"}))
+        queue.put(
+            QueueMessage(
+                iteration=5, df_source_records=pl.DataFrame(schema=source_record_schema), signal=QUEUE_TERMINATION
+            )
+        )
+
+        assert queue.qsize() == 2
+        assert len(os.listdir(directory)) == 2
+
+        queue_message = queue.get()
+        assert queue_message.iteration == 4
+        assert queue_message.pagination == {"cursor": "next"}
+        assert queue_message.df_source_records.schema == source_record_schema
+        assert queue_message.df_source_records.equals(df_source_records)
+
+        last_message = queue.get()
+        assert last_message.signal == QUEUE_TERMINATION
+        assert last_message.df_source_records.height == 0
+
+        # Batches are unlinked as soon as they are mapped by the consumer
+        assert queue.empty()
+        assert os.listdir(directory) == []
+    finally:
+        manager.shutdown()
+        remove_shared_memory_directory(directory)
+
+    assert not os.path.exists(directory)
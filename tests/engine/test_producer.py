@@ -8,6 +8,7 @@ import pytest
 from bizon.engine.backend.backend import AbstractBackend
 from bizon.engine.backend.models import JobStatus, StreamJob
 from bizon.engine.engine import RunnerFactory
+from bizon.engine.pipeline.models import PipelineReturnStatus
 from bizon.engine.pipeline.producer import Producer
 from bizon.source.models import SourceIteration, SourceRecord
 
@@ -112,3 +113,40 @@ def test_queue_is_full(my_producer: Producer, sqlite_db_session, my_job: StreamJ
     assert is_queue_full is True
     assert queue_size == 1001
     assert approximate_nb_records_in_queue == 1_001_000
+
+
+def drain_queue(queue) -> list:
+    messages = []
+    while not queue.queue.empty():
+        messages.append(queue.queue.get())
+    return messages
+
+
+def test_producer_prefetch_keeps_iterations_in_order(my_producer: Producer, sqlite_db_session, my_job: StreamJob):
+    my_producer.run(job_id=my_job.id, stop_event=threading.Event())
+    expected = drain_queue(my_producer.queue)
+
+    my_producer.bizon_config.engine.runner.config.prefetch_depth = 2
+    assert my_producer.prefetch_depth == 2
+
+    status = my_producer.run(job_id=my_job.id, stop_event=threading.Event())
+    messages = drain_queue(my_producer.queue)
+
+    assert status == PipelineReturnStatus.SUCCESS
+    assert [message.iteration for message in messages] == [message.iteration for message in expected]
+    assert [message.pagination for message in messages] == [message.pagination for message in expected]
+    assert [message.df_source_records["id"].to_list() for message in messages] == [
+        message.df_source_records["id"].to_list() for message in expected
+    ]
+
+
+def test_producer_prefetch_surfaces_source_error(my_producer: Producer, sqlite_db_session, my_job: StreamJob):
+    my_producer.bizon_config.engine.runner.config.prefetch_depth = 2
+
+    def failing_get(pagination: dict = None):
+        raise ConnectionError("API is down")
+
+    my_producer.source.get = failing_get
+
+    status = my_producer.run(job_id=my_job.id, stop_event=threading.Event())
+    assert status == PipelineReturnStatus.SOURCE_ERROR
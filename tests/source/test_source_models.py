@@ -0,0 +1,68 @@
+from datetime import datetime
+from queue import Queue
+
+import polars as pl
+import pytest
+from pytz import UTC
+
+from bizon.engine.queue.adapters.python_queue.config import PythonQueueConfigDetails
+from bizon.engine.queue.adapters.python_queue.queue import PythonQueue
+from bizon.source.models import SourceIteration, SourceRecord, source_record_schema
+
+df_source_records = pl.DataFrame(
+    {
+        "id": ["record_1", "record_2"],
+        "data": ['{"key": "value1"}', '{"key": "value2"}'],
+        "timestamp": [datetime(2024, 12, 5, 11, 30, tzinfo=UTC), datetime(2024, 12, 5, 12, 30, tzinfo=UTC)],
+        "destination_id": ["test", "test"],
+    },
+    schema=source_record_schema,
+)
+
+
+def test_source_iteration_records():
+    source_iteration = SourceIteration(
+        next_pagination={},
+        records=[SourceRecord(id=1, data={"key": "é"}, timestamp=datetime(2024, 12, 5, tzinfo=UTC))],
+    )
+    assert source_iteration.nb_records == 1
+
+    df = source_iteration.to_df_source_records()
+    assert df.schema == source_record_schema
+    assert df["data"].to_list() == ['{"key": "é"}']
+
+
+def test_source_iteration_columnar_batch_is_used_as_is():
+    source_iteration = SourceIteration(next_pagination={"cursor": "next"}, df_records=df_source_records)
+
+    assert source_iteration.records == []
+    assert source_iteration.nb_records == 2
+    assert source_iteration.to_df_source_records() is df_source_records
+
+
+def test_source_iteration_columnar_batch_from_arrow():
+    table = df_source_records.with_columns(pl.col("timestamp").cast(pl.Datetime("ms", "UTC"))).to_arrow()
+
+    source_iteration = SourceIteration(next_pagination={}, df_records=table)
+
+    assert source_iteration.df_records.schema == source_record_schema
+    assert source_iteration.df_records.equals(df_source_records)
+
+
+def test_source_iteration_columnar_batch_missing_columns():
+    with pytest.raises(ValueError, match="missing columns"):
+        SourceIteration(next_pagination={}, df_records=df_source_records.drop("destination_id"))
+
+
+def test_queue_put_columnar_batch():
+    queue = PythonQueue(config=PythonQueueConfigDetails(), queue=Queue())
+
+    queue.put(
+        source_iteration=SourceIteration(next_pagination={"cursor": "next"}, df_records=df_source_records),
+        iteration=3,
+    )
+
+    queue_message = queue.queue.get()
+    assert queue_message.iteration == 3
+    assert queue_message.pagination == {"cursor": "next"}
+    assert queue_message.df_source_records.equals(df_source_records)